@@ -17,7 +17,6 @@ import rich.prompt
 
 # Set up logging
 log = logging.getLogger(__name__)
-log.setLevel(logging.INFO)
 
 
 def check_name(name: str) -> bool:
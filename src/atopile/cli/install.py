@@ -20,7 +20,6 @@ from git import InvalidGitRepositoryError, NoSuchPathError, Repo
 from atopile import config, errors, version
 
 log = logging.getLogger(__name__)
-log.setLevel(logging.INFO)
 
 
 @click.command("install")
@@ -5,7 +5,6 @@ import logging
 from typing import Generic, Iterable, Iterator, Mapping, Optional, Type, TypeVar
 
 log = logging.getLogger(__name__)
-log.setLevel(logging.INFO)
 
 
 class Ref(tuple[str]):
@@ -6,6 +6,7 @@ In building this datamodel, we check for name collisions, but we don't resolve t
 import enum
 from collections import ChainMap
 from contextlib import ExitStack, contextmanager
+from functools import cache
 from itertools import chain
 from pathlib import Path
 from typing import Any, Callable, Iterable, Mapping, Optional
@@ -25,14 +26,21 @@ from atopile.parser.AtopileParser import AtopileParser as ap
 from atopile.parser.AtopileParserVisitor import AtopileParserVisitor
 
 
-@define
+@define(eq=False, weakref_slot=False)
 class Base:
-    """Represent a base class for all things."""
+    """
+    Represent a base class for all things.
+
+    These use identity equality and hashing (eq=False), because they're graph
+    nodes rather than values, and attrs' generated __eq__ would walk every
+    field (recursively through children) on each comparison.
+    Physical is the exception, since it's a value.
+    """
 
     src_ctx: Optional[ParserRuleContext] = field(kw_only=True, default=None)
 
 
-@define
+@define(eq=False, weakref_slot=False)
 class Import(Base):
     """Represent an import statement."""
 
@@ -42,14 +50,14 @@ class Import(Base):
         return f"<Import {self.obj_addr}>"
 
 
-@define
+@define(eq=False, weakref_slot=False)
 class Replacement(Base):
     """Represent a replacement statement."""
 
     new_super_ref: Ref
 
 
-@define(repr=False)
+@define(repr=False, eq=False, weakref_slot=False)
 class ObjectDef(Base):
     """
     Represent the definition or skeleton of an object
@@ -71,6 +79,9 @@ class ObjectDef(Base):
     closure: Optional[tuple["ObjectDef"]] = None  # in order of lookup
     address: Optional[AddrStr] = None
 
+    # memo of refs already resolved through this object's closure
+    lookup_cache: dict[Ref, AddrStr] = field(factory=dict, init=False)
+
     def __repr__(self) -> str:
         return f"<{self.__class__.__name__} {self.address}>"
 
@@ -113,7 +124,7 @@ class Physical(Base):
         return data
 
 
-@define(repr=False)
+@define(repr=False, eq=False, weakref_slot=False)
 class ObjectLayer(Base):
     """
     Represent a layer in the object hierarchy.
@@ -149,7 +160,7 @@ resolve_types(ObjectLayer)
 ## The below datastructures are created from the above datamodel as a second stage
 
 
-@define
+@define(eq=False, weakref_slot=False)
 class Link(Base):
     """Represent a connection between two connectable things."""
 
@@ -168,7 +179,7 @@ class Link(Base):
         return f"<Link {repr(self.source)} -> {repr(self.target)}>"
 
 
-@define
+@define(eq=False, weakref_slot=False)
 class Instance(Base):
     """
     Represents the specific instance, capturing, the story you told of
@@ -179,7 +190,8 @@ class Instance(Base):
     # much of this information is redundant, however it's all highly referenced
     # so it's useful to have it all at hand
     addr: AddrStr
-    supers: list["ObjectLayer"] = field(factory=list)
+    # shared between all instances of the same class
+    supers: tuple["ObjectLayer", ...] = ()
     children: dict[str, "Instance"] = field(factory=dict)
     links: list[Link] = field(factory=list)
 
@@ -188,7 +200,6 @@ class Instance(Base):
     ] = None  # this is a chainmap inheriting from the supers as well
 
     override_data: dict[str, Any] = field(factory=dict)
-    _override_location: dict[str, ObjectLayer] = field(factory=dict)
 
     # TODO: for later
     # lock_data: Optional[Mapping[str, Any]] = None
@@ -245,6 +256,14 @@ BUILTINS_BY_REF = {
 }
 
 
+# the implicit super of a block, by the keyword it's declared with
+BLOCKTYPE_SUPER_REFS = {
+    "module": Ref.from_one("MODULE"),
+    "component": Ref.from_one("COMPONENT"),
+    "interface": Ref.from_one("INTERFACE"),
+}
+
+
 BUILTINS_BY_ADDR = {
     MODULE.address: MODULE,
     COMPONENT.address: COMPONENT,
@@ -254,17 +273,30 @@ BUILTINS_BY_ADDR = {
 }
 
 
+@cache
+def _get_unit(unit_str: str) -> pint.Unit:
+    """Return a pint unit from its name, parsing each name only once."""
+    return pint.Unit(unit_str)
+
+
 def _get_unit_from_ctx(ctx: ParserRuleContext) -> pint.Unit:
     """Return a pint unit from a context."""
     unit_str = ctx.getText()
     try:
-        return pint.Unit(unit_str)
+        return _get_unit(unit_str)
     except pint.UndefinedUnitError as ex:
         raise errors.AtoUnknownUnitError.from_ctx(
             ctx, f"Unknown unit '{unit_str}'"
         ) from ex
 
 
+def _get_rule_index(tree: Any) -> int:
+    """Return the rule index of a parse tree node, or -1 if it's a terminal."""
+    if isinstance(tree, ParserRuleContext):
+        return tree.getRuleIndex()
+    return -1
+
+
 class BaseTranslator(AtopileParserVisitor):
     """
     Dizzy is responsible for mixing cement, sand, aggregate, and water to create concrete.
@@ -274,8 +306,30 @@ class BaseTranslator(AtopileParserVisitor):
     def __init__(
         self,
     ) -> None:
+        # map each rule index to the (bound) visitor method handling that rule
+        # this is looked up on the instance, so subclass overrides are respected
+        self._dispatch: dict[int, Callable] = {
+            rule_index: getattr(self, "visit" + rule_name[0].upper() + rule_name[1:])
+            for rule_index, rule_name in enumerate(ap.ruleNames)
+        }
         super().__init__()
 
+    def visit(self, tree):
+        """
+        Dispatch straight to the visitor method for the rule, rather than
+        bouncing through the generated accept() and its hasattr() check.
+        """
+        if isinstance(tree, ParserRuleContext):
+            return self._dispatch[tree.getRuleIndex()](tree)
+        return tree.accept(self)
+
+    def visitChildren(self, node):
+        """Visit children through our own dispatch, not through accept()."""
+        result = self.defaultResult()
+        for child in node.getChildren():
+            result = self.aggregateResult(result, self.visit(child))
+        return result
+
     def defaultResult(self):
         """
         Override the default "None" return type
@@ -297,11 +351,12 @@ class BaseTranslator(AtopileParserVisitor):
                     if child_result is not NOTHING:
                         yield child_result
 
-        child_results = chain.from_iterable(__visit())
-        child_results = list(item for item in child_results if item is not NOTHING)
-        child_results = KeyOptMap(KeyOptItem(cr) for cr in child_results)
-
-        return KeyOptMap(child_results)
+        # most children hand back KeyOptItems already, so only wrap the ones that aren't
+        return KeyOptMap(
+            cr if isinstance(cr, KeyOptItem) else KeyOptItem(cr)
+            for cr in chain.from_iterable(__visit())
+            if cr is not NOTHING
+        )
 
     def visit_ref_helper(
         self,
@@ -313,21 +368,16 @@ class BaseTranslator(AtopileParserVisitor):
         """
         Visit any referencey thing and ensure it's returned as a reference
         """
-        if isinstance(
-            ctx,
-            (
-                ap.NameContext,
-                ap.Totally_an_integerContext,
-            ),
-        ):
-            return Ref.from_one(str(self.visit(ctx)))
-        if isinstance(ctx, ap.Numerical_pin_refContext):
-            name_part = self.visit_ref_helper(ctx.name_or_attr())
-            return name_part.add_name(str(self.visit(ctx)))
-        if isinstance(ctx, (ap.AttrContext, ap.Name_or_attrContext)):
-            return Ref(
-                map(str, self.visit(ctx)),
-            )
+        match _get_rule_index(ctx):
+            case ap.RULE_name | ap.RULE_totally_an_integer:
+                return Ref.from_one(str(self.visit(ctx)))
+            case ap.RULE_numerical_pin_ref:
+                name_part = self.visit_ref_helper(ctx.name_or_attr())
+                return name_part.add_name(str(self.visit(ctx)))
+            case ap.RULE_attr | ap.RULE_name_or_attr:
+                return Ref(
+                    map(str, self.visit(ctx)),
+                )
         raise errors.AtoError(f"Unknown reference type: {type(ctx)}")
 
     def visitName(self, ctx: ap.NameContext) -> str:
@@ -340,11 +390,12 @@ class BaseTranslator(AtopileParserVisitor):
         return Ref(self.visitName(name) for name in ctx.name())
 
     def visitName_or_attr(self, ctx: ap.Name_or_attrContext) -> Ref:
-        if ctx.name():
-            name = self.visitName(ctx.name())
-            return Ref.from_one(name)
-        elif ctx.attr():
-            return self.visitAttr(ctx.attr())
+        child = ctx.getChild(0)
+        match _get_rule_index(child):
+            case ap.RULE_name:
+                return Ref.from_one(self.visitName(child))
+            case ap.RULE_attr:
+                return self.visitAttr(child)
 
         raise errors.AtoError("Expected a name or attribute")
 
@@ -398,10 +449,11 @@ class BaseTranslator(AtopileParserVisitor):
         """Yield a physical value from an implicit quantity context."""
         value = float(ctx.NUMBER().getText())
 
-        if ctx.name():
-            unit = _get_unit_from_ctx(ctx.name())
+        unit_ctx = ctx.name()
+        if unit_ctx:
+            unit = _get_unit_from_ctx(unit_ctx)
         else:
-            unit = pint.Unit("")
+            unit = _get_unit("")
 
         return Physical(
             src_ctx=ctx,
@@ -412,20 +464,23 @@ class BaseTranslator(AtopileParserVisitor):
 
     def visitBilateral_quantity(self, ctx: AtopileParser.Bilateral_quantityContext) -> Physical:
         """Yield a physical value from a bilateral quantity context."""
-        nominal = float(ctx.bilateral_nominal().NUMBER().getText())
+        nominal_ctx = ctx.bilateral_nominal()
+        nominal = float(nominal_ctx.NUMBER().getText())
 
-        if ctx.bilateral_nominal().name():
-            unit = _get_unit_from_ctx(ctx.bilateral_nominal().name())
+        unit_ctx = nominal_ctx.name()
+        if unit_ctx:
+            unit = _get_unit_from_ctx(unit_ctx)
         else:
-            unit = pint.Unit("")
+            unit = _get_unit("")
 
         tol_ctx: AtopileParser.Bilateral_toleranceContext = ctx.bilateral_tolerance()
         tol_num = float(tol_ctx.NUMBER().getText())
+        tol_unit_ctx = tol_ctx.name()
 
         if tol_ctx.PERCENT():
             tol_divider = 100
         # FIXME: hardcoding this seems wrong, but the parser/lexer wasn't picking up on it
-        elif tol_ctx.name() and tol_ctx.name().getText() == "ppm":
+        elif tol_unit_ctx and tol_unit_ctx.getText() == "ppm":
             tol_divider = 1E6
         else:
             tol_divider = None
@@ -439,15 +494,15 @@ class BaseTranslator(AtopileParserVisitor):
                 unit=unit,
             )
 
-        if tol_ctx.name():
+        if tol_unit_ctx:
             # In this case there's a named unit on the tolerance itself
             # We need to make sure it's dimensionally compatible with the nominal
-            tolerance_unit = _get_unit_from_ctx(tol_ctx.name())
+            tolerance_unit = _get_unit_from_ctx(tol_unit_ctx)
             try:
                 tolerance = (tol_num * tolerance_unit).to(unit).magnitude
             except pint.DimensionalityError as ex:
                 raise errors.AtoTypeError.from_ctx(
-                    tol_ctx.name(),
+                    tol_unit_ctx,
                     f"Tolerance unit '{tolerance_unit}' is not dimensionally"
                     f" compatible with nominal unit '{unit}'",
                 ) from ex
@@ -472,8 +527,9 @@ class BaseTranslator(AtopileParserVisitor):
         """Yield a physical value from a bound quantity context."""
         def _parse_end(ctx: AtopileParser.Quantity_endContext) -> tuple[float, Optional[pint.Unit]]:
             value = float(ctx.NUMBER().getText())
-            if ctx.name():
-                unit = _get_unit_from_ctx(ctx.name())
+            unit_ctx = ctx.name()
+            if unit_ctx:
+                unit = _get_unit_from_ctx(unit_ctx)
             else:
                 unit = None
             return value, unit
@@ -482,7 +538,7 @@ class BaseTranslator(AtopileParserVisitor):
         end_val, end_unit = _parse_end(ctx.quantity_end(1))
 
         if start_unit is None and end_unit is None:
-            unit = pint.Unit("")
+            unit = _get_unit("")
         elif start_unit and end_unit:
             unit = start_unit
             try:
@@ -518,16 +574,20 @@ class BaseTranslator(AtopileParserVisitor):
 
     def visitAssignable(self, ctx: ap.AssignableContext) -> Physical | str | bool:
         """Yield something we can place in a set of locals."""
-        if ctx.physical():
-            return self.visitPhysical(ctx.physical())
-
-        if ctx.string():
-            return self.visitString(ctx)
+        # an assignable has exactly one child, so switch on its rule
+        # rather than probing for each alternative in turn
+        child = ctx.getChild(0)
+        match _get_rule_index(child):
+            case ap.RULE_physical:
+                return self.visitPhysical(child)
+            case ap.RULE_string:
+                return self.visitString(child)
+            case ap.RULE_new_stmt:
+                raise AssertionError(
+                    "New statements should have already been filtered out."
+                )
 
-        assert (
-            not ctx.new_stmt()
-        ), "New statements should have already been filtered out."
-        raise TypeError(f"Unexpected assignable type {type(ctx)}")
+        raise TypeError(f"Unexpected assignable type {type(child)}")
 
     def visitTotally_an_integer(self, ctx: ap.Totally_an_integerContext) -> int:
         text = ctx.getText()
@@ -608,12 +668,18 @@ class Scoop(BaseTranslator):
 
     def visitBlockdef(self, ctx: ap.BlockdefContext) -> KeyOptItem[ObjectDef]:
         """Visit a blockdef and return it's object."""
+        # only blocks without a "from" clause fall back to their block type's super
         if ctx.FROM():
-            if not ctx.name_or_attr():
+            super_ctx = ctx.name_or_attr()
+            if not super_ctx:
                 raise errors.AtoSyntaxError("Expected a name or attribute after 'from'")
-            block_super_ref = self.visit_ref_helper(ctx.name_or_attr())
+            block_super_ref = self.visitName_or_attr(super_ctx)
         else:
-            block_super_ref = self.visitBlocktype(ctx.blocktype())
+            block_type_name = ctx.blocktype().getText()
+            try:
+                block_super_ref = BLOCKTYPE_SUPER_REFS[block_type_name]
+            except KeyError as ex:
+                raise errors.AtoError(f"Unknown block type '{block_type_name}'") from ex
 
         locals_ = self.visitBlock(ctx.block())
 
@@ -639,7 +705,7 @@ class Scoop(BaseTranslator):
             replacements=replacements,
         )
 
-        block_name = self.visit_ref_helper(ctx.name())
+        block_name = Ref.from_one(self.visitName(ctx.name()))
 
         return KeyOptItem.from_kv(block_name, block_obj)
 
@@ -688,19 +754,6 @@ class Scoop(BaseTranslator):
 
         return KeyOptMap.from_kv(import_what_ref, import_)
 
-    def visitBlocktype(self, ctx: ap.BlocktypeContext) -> Ref:
-        """Return the address of a block type."""
-        block_type_name = ctx.getText()
-        match block_type_name:
-            case "module":
-                return Ref.from_one("MODULE")
-            case "component":
-                return Ref.from_one("COMPONENT")
-            case "interface":
-                return Ref.from_one("INTERFACE")
-            case _:
-                raise errors.AtoError(f"Unknown block type '{block_type_name}'")
-
     def visitRetype_stmt(self, ctx: ap.Retype_stmtContext) -> KeyOptMap:
         """TODO:"""
         # TODO: we should check the validity of the replacement here
@@ -728,29 +781,37 @@ class Scoop(BaseTranslator):
 def lookup_obj_in_closure(context: ObjectDef, ref: Ref) -> AddrStr:
     """
     This method finds an object in the closure of another object, traversing import statements.
+    Successful lookups are memoized on the context, since closures don't change once registered.
     """
-    assert context.closure is not None
-    for scope in context.closure:
-        obj_lead = scope.local_defs.get(ref[:1])
-        import_leads = {
-            imp_ref: imp
-            for imp_ref, imp in scope.imports.items()
-            if ref[0] == imp_ref[0]
-        }
+    try:
+        return context.lookup_cache[ref]
+    except KeyError:
+        pass
+
+    addr = context.lookup_cache[ref] = _lookup_obj_in_closure(context, ref)
+    return addr
 
-        if import_leads and obj_lead:
-            # TODO: improve error message with details about what items are conflicting
-            raise errors.AtoAmbiguousReferenceError.from_ctx(
-                scope.src_ctx, f"Name '{ref[0]}' is ambiguous in '{scope}'."
-            )
 
+def _lookup_obj_in_closure(context: ObjectDef, ref: Ref) -> AddrStr:
+    assert context.closure is not None
+    head = ref[0]
+    head_ref = ref[:1]
+    for scope in context.closure:
+        obj_lead = scope.local_defs.get(head_ref)
         if obj_lead is not None:
+            if any(imp_ref[0] == head for imp_ref in scope.imports):
+                # TODO: improve error message with details about what items are conflicting
+                raise errors.AtoAmbiguousReferenceError.from_ctx(
+                    scope.src_ctx, f"Name '{head}' is ambiguous in '{scope}'."
+                )
+
             if len(ref) > 1:
                 raise NotImplementedError
             return obj_lead.address
 
-        if ref in scope.imports:
-            return scope.imports[ref].obj_addr
+        import_ = scope.imports.get(ref)
+        if import_ is not None:
+            return import_.obj_addr
 
     if ref in BUILTINS_BY_REF:
         return BUILTINS_BY_REF[ref].address
@@ -830,7 +891,7 @@ class Dizzy(BaseTranslator):
     def visitAssign_stmt(self, ctx: ap.Assign_stmtContext) -> KeyOptMap:
         assignable_ctx = ctx.assignable()
         assert isinstance(assignable_ctx, ap.AssignableContext)
-        if assignable_ctx.new_stmt():
+        if _get_rule_index(assignable_ctx.getChild(0)) == ap.RULE_new_stmt:
             # ignore new statements here, we'll deal with them in future layers
             return KeyOptMap.empty()
 
@@ -839,7 +900,7 @@ class Dizzy(BaseTranslator):
             # we'll deal with overrides later too!
             return KeyOptMap.empty()
 
-        assigned_value = self.visitAssignable(ctx.assignable())
+        assigned_value = self.visitAssignable(assignable_ctx)
         return KeyOptMap.from_kv(assigned_value_ref, assigned_value)
 
     def visitSimple_stmt(
@@ -877,6 +938,7 @@ class Lofty(BaseTranslator):
         # thing that called for that replacement, and the object that will replace it
         self._known_replacements: dict[AddrStr, AddrStr] = {}
         self.obj_layer_getter = obj_layer_getter
+        self._supers_cache: dict[ObjectLayer, tuple[ObjectLayer, ...]] = {}
 
         self._instance_context_stack: list[AddrStr] = []
         self._obj_context_stack: list[AddrStr] = []
@@ -893,6 +955,20 @@ class Lofty(BaseTranslator):
             assert isinstance(self._output_cache[addr], Instance)
         return self._output_cache[addr]
 
+    def get_supers(self, super_obj: ObjectLayer) -> tuple[ObjectLayer, ...]:
+        """
+        Return the chain of supers starting at an object layer.
+        These are cached, so all instances of the same class share one tuple.
+        """
+        try:
+            return self._supers_cache[super_obj]
+        except KeyError:
+            pass
+
+        supers = tuple(recurse(lambda x: x.super, super_obj))
+        self._supers_cache[super_obj] = supers
+        return supers
+
     @contextmanager
     def enter_instance(self, instance: AddrStr):
         """TODO:"""
@@ -942,7 +1018,7 @@ class Lofty(BaseTranslator):
         """Create an instance from a reference and a super object layer."""
         # FIXME: this should deal with name collisions and type collisions
 
-        supers = list(recurse(lambda x: x.super, super_obj))
+        supers = self.get_supers(super_obj)
         override_data: dict[str, Any] = {}
         data = ChainMap(override_data, *[s.data for s in supers])
         new_instance = self._output_cache[new_addr] = Instance(
@@ -990,8 +1066,8 @@ class Lofty(BaseTranslator):
 
         # Handle New Statements
         # FIXME: this is a giant fucking mess
-        if assignable_ctx.new_stmt():
-            new_stmt = assignable_ctx.new_stmt()
+        new_stmt = assignable_ctx.new_stmt()
+        if new_stmt:
             assert isinstance(new_stmt, ap.New_stmtContext)
             if len(assigned_ref) != 1:
                 raise errors.AtoError(
@@ -1034,7 +1110,7 @@ class Lofty(BaseTranslator):
         if len(assigned_ref) == 1:
             return KeyOptMap.empty()
 
-        assigned_value = self.visitAssignable(ctx.assignable())
+        assigned_value = self.visitAssignable(assignable_ctx)
         instance_addr_assigned_to = address.add_instances(
             self._instance_context_stack[-1], assigned_ref[:-1]
         )
@@ -1066,7 +1142,7 @@ class Lofty(BaseTranslator):
         pin_or_signal = Instance(
             src_ctx=ctx,
             addr=new_addr,
-            supers=[super_],
+            supers=self.get_supers(super_),
             override_data=override_data,
             data=ChainMap(override_data, super_.data),
         )
@@ -92,8 +92,8 @@ def find_matching_super(
     return None
 
 
-def get_supers_list(addr: AddrStr) -> list[ObjectLayer]:
-    """Return the supers of an object as a list of ObjectLayers."""
+def get_supers_list(addr: AddrStr) -> tuple[ObjectLayer, ...]:
+    """Return the supers of an object as a sequence of ObjectLayers."""
     return lofty._output_cache[addr].supers
 
 
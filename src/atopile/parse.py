@@ -11,7 +11,6 @@ from atopile.parser.AtopileParser import AtopileParser
 from .errors import AtoSyntaxError, AtoFileNotFoundError
 
 log = logging.getLogger(__name__)
-log.setLevel(logging.INFO)
 
 
 class ErrorListenerConverter(ErrorListener):
@@ -95,8 +94,9 @@ class FileParser:
         self, src_path: str | Path
     ) -> AtopileParser.File_inputContext:
         """Get the AST from a file."""
+        # normalise the key first, so str and Path lookups share the same entry
+        src_path = Path(src_path)
         if src_path not in self.cache:
-            src_path = Path(src_path)
             if not src_path.exists():
                 raise AtoFileNotFoundError(str(src_path))
             self.cache[src_path] = parse_file(src_path)
@@ -10,7 +10,6 @@ from semver import Version
 from atopile import errors
 
 log = logging.getLogger(__name__)
-log.setLevel(logging.INFO)
 
 
 class VersionMismatchError(errors.AtoError):
@@ -1,7 +1,7 @@
 import logging
 import json
 from pathlib import Path
-from typing import Any
+from typing import Any, Optional
 import pcbnew
 
 LOG_FILE = Path("~/.atopile/kicad-plugin.log").expanduser().absolute()
@@ -73,12 +73,24 @@ def sync_track(track: pcbnew.PCB_TRACK, target: pcbnew.BOARD) -> pcbnew.PCB_TRAC
 
 
 def sync_footprints(
-    source: pcbnew.BOARD, target: pcbnew.BOARD, uuid_map: dict[str, str]
+    source: pcbnew.BOARD,
+    target: pcbnew.BOARD,
+    uuid_map: dict[str, str],
+    source_uuids: Optional[dict[str, pcbnew.FOOTPRINT]] = None,
+    target_uuids: Optional[dict[str, pcbnew.FOOTPRINT]] = None,
 ):
-    """Update the target board with the layout from the source board."""
+    """
+    Update the target board with the layout from the source board.
+
+    Pass the boards' footprints_by_uuid maps if you already have them,
+    eg. when syncing many groups to or from the same board.
+    """
+    if source_uuids is None:
+        source_uuids = footprints_by_uuid(source)
+    if target_uuids is None:
+        target_uuids = footprints_by_uuid(target)
+
     # Update the footprint position, orientation, and side to match the source
-    source_uuids = footprints_by_uuid(source)
-    target_uuids = footprints_by_uuid(target)
     for s_uuid, t_uuid in uuid_map.items():
         target_fp = target_uuids[t_uuid]
         source_fp = source_uuids[s_uuid]
@@ -3,7 +3,13 @@ from pathlib import Path
 
 import pcbnew
 
-from .common import get_layout_map, sync_footprints, flip_dict, sync_track
+from .common import (
+    flip_dict,
+    footprints_by_uuid,
+    get_layout_map,
+    sync_footprints,
+    sync_track,
+)
 
 log = logging.getLogger(__name__)
 
@@ -22,6 +28,9 @@ class PullGroup(pcbnew.ActionPlugin):
         board_path = target_board.GetFileName()
         known_layouts = get_layout_map(board_path)
 
+        # Pulling only moves footprints, the set of them stays the same
+        target_fps = footprints_by_uuid(target_board)
+
         # Pull Selected Groups
         for g in target_board.Groups():
             assert isinstance(g, pcbnew.PCB_GROUP)
@@ -30,11 +39,11 @@ class PullGroup(pcbnew.ActionPlugin):
             if not g.IsSelected():
                 continue
 
-            g_name = g.GetName()
-            if g_name not in known_layouts:
+            g_layout = known_layouts.get(g.GetName())
+            if g_layout is None:
                 continue
 
-            layout_path = Path(known_layouts[g_name]["layout_path"])
+            layout_path = Path(g_layout["layout_path"])
             # Check what layouts exist
             if not layout_path.exists():
                 raise FileNotFoundError(
@@ -42,14 +51,18 @@ class PullGroup(pcbnew.ActionPlugin):
                 )
 
             # Remove everything but the footprints from the target group
-            for item in g.GetItems():
+            # Take a copy first, we can't remove from the board while iterating it
+            for item in list(g.GetItems()):
                 if not isinstance(item, pcbnew.FOOTPRINT):
                     target_board.Remove(item)
 
             # Load the layout and sync
             source_board: pcbnew.BOARD = pcbnew.LoadBoard(str(layout_path))
             sync_footprints(
-                source_board, target_board, flip_dict(known_layouts[g_name]["uuid_map"])
+                source_board,
+                target_board,
+                flip_dict(g_layout["uuid_map"]),
+                target_uuids=target_fps,
             )
 
             for track in source_board.GetTracks():
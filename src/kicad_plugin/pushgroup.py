@@ -3,7 +3,7 @@ from pathlib import Path
 
 import pcbnew
 
-from .common import get_layout_map, sync_footprints, sync_track
+from .common import footprints_by_uuid, get_layout_map, sync_footprints, sync_track
 
 log = logging.getLogger(__name__)
 
@@ -22,6 +22,9 @@ class PushGroup(pcbnew.ActionPlugin):
         board_path = source_board.GetFileName()
         known_layouts = get_layout_map(board_path)
 
+        # The source board doesn't change while we push, so only index it once
+        source_fps = footprints_by_uuid(source_board)
+
         # Push Selected Groups
         for g in source_board.Groups():
             assert isinstance(g, pcbnew.PCB_GROUP)
@@ -30,11 +33,11 @@ class PushGroup(pcbnew.ActionPlugin):
             if not g.IsSelected():
                 continue
 
-            g_name = g.GetName()
-            if g_name not in known_layouts:
+            g_layout = known_layouts.get(g.GetName())
+            if g_layout is None:
                 continue
 
-            layout_path = Path(known_layouts[g_name]["layout_path"])
+            layout_path = Path(g_layout["layout_path"])
 
             # Check what layouts exist
             if not layout_path.exists():
@@ -45,18 +48,22 @@ class PushGroup(pcbnew.ActionPlugin):
             target_board: pcbnew.BOARD = pcbnew.LoadBoard(str(layout_path))
 
             # Remove everything but the footprints from the target board
-            for item in target_board.GetTracks():
+            # Take a copy first, we can't remove from the board while iterating it
+            for item in list(target_board.GetTracks()):
                 target_board.Remove(item)
 
             # Push the layout
             sync_footprints(
-                source_board, target_board, known_layouts[g_name]["uuid_map"]
+                source_board,
+                target_board,
+                g_layout["uuid_map"],
+                source_uuids=source_fps,
             )
             for track in g.GetItems():
                 if isinstance(track, pcbnew.PCB_TRACK):
                     sync_track(track, target_board)
 
-        # Save the target board
-        target_board.Save(target_board.GetFileName())
+            # Save the target board, once per group we've pushed
+            target_board.Save(target_board.GetFileName())
 
 PushGroup().register()
@@ -0,0 +1,115 @@
+from pathlib import Path
+from typing import Optional
+
+import pytest
+
+from atopile import errors
+from atopile.datatypes import KeyOptMap, Ref
+from atopile.front_end import (
+    PIN,
+    BaseTranslator,
+    Import,
+    ObjectDef,
+    lofty,
+    lookup_obj_in_closure,
+)
+from atopile.instance_methods import find_matching_super
+from atopile.parse import parse_text_as_file
+from atopile.parser.AtopileParser import AtopileParser as ap
+
+
+class _AssignRecorder(BaseTranslator):
+    """Toy translator, recording the assignments it's dispatched to."""
+
+    def __init__(self) -> None:
+        self.assigned = []
+        super().__init__()
+
+    def visitAssign_stmt(self, ctx: ap.Assign_stmtContext) -> KeyOptMap:
+        self.assigned.append(ctx.name_or_attr().getText())
+        return KeyOptMap.empty()
+
+
+def test_visit_reaches_subclass_override():
+    tree = parse_text_as_file("module A:\n    x = 1\n    y = 2\n", "test.ato")
+
+    block = tree.stmt(0).compound_stmt().blockdef().block()
+
+    recorder = _AssignRecorder()
+    recorder.visit(block)
+    assert recorder.assigned == ["x", "y"]
+
+
+def test_visit_on_base_translator():
+    tree = parse_text_as_file("x = 1\n", "test.ato")
+    name_ctx = tree.stmt(0).simple_stmts().simple_stmt(0).assign_stmt().name_or_attr()
+    assert BaseTranslator().visit(name_ctx) == ("x",)
+
+
+def _make_obj_def(
+    address: str,
+    *,
+    imports: Optional[dict] = None,
+    local_defs: Optional[dict] = None,
+) -> ObjectDef:
+    obj_def = ObjectDef(
+        src_ctx=parse_text_as_file("x = 1\n", "test.ato"),
+        super_ref=None,
+        imports=imports or {},
+        local_defs=local_defs or {},
+        replacements={},
+    )
+    obj_def.address = address
+    obj_def.closure = (obj_def,)
+    return obj_def
+
+
+def test_lookup_obj_in_closure_is_cached():
+    child = _make_obj_def("test.ato:A")
+    file = _make_obj_def("test.ato", local_defs={Ref.from_one("A"): child})
+
+    assert lookup_obj_in_closure(file, Ref.from_one("A")) == "test.ato:A"
+    assert file.lookup_cache == {("A",): "test.ato:A"}
+    assert lookup_obj_in_closure(file, Ref.from_one("A")) == "test.ato:A"
+
+
+def test_lookup_obj_in_closure_failures_not_cached():
+    child = _make_obj_def("test.ato:A")
+    file = _make_obj_def(
+        "test.ato",
+        local_defs={Ref.from_one("A"): child},
+        imports={Ref.from_one("A"): Import(obj_addr="other.ato:A")},
+    )
+
+    for _ in range(2):
+        with pytest.raises(KeyError):
+            lookup_obj_in_closure(file, Ref.from_one("B"))
+        with pytest.raises(errors.AtoAmbiguousReferenceError):
+            lookup_obj_in_closure(file, Ref.from_one("A"))
+
+    assert file.lookup_cache == {}
+
+
+def test_supers_shared_between_instances(tmp_path: Path):
+    src = tmp_path / "test.ato"
+    src.write_text(
+        "component R:\n"
+        "    pin 1\n"
+        "    pin 2\n"
+        "\n"
+        "module App:\n"
+        "    r1 = new R\n"
+        "    r2 = new R\n"
+    )
+
+    root = lofty.get_instance_tree(f"{src}:App")
+    r1, r2 = root.children["r1"], root.children["r2"]
+    assert isinstance(r1.supers, tuple)
+    assert r1.supers is r2.supers
+    assert r1.children["1"].supers == (PIN,)
+    assert r1.children["1"].supers is r2.children["2"].supers
+
+    assert find_matching_super(r1.addr, ["<Built-in>:Component"]) == (
+        "<Built-in>:Component"
+    )
+    assert find_matching_super(r1.addr, ["<Built-in>:Interface"]) is None
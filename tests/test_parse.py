@@ -0,0 +1,13 @@
+from pathlib import Path
+
+from atopile.parse import FileParser
+
+
+def test_ast_cache_shared_between_str_and_path(tmp_path: Path):
+    src = tmp_path / "test.ato"
+    src.write_text("module A:\n    x = 1\n")
+
+    file_parser = FileParser()
+    tree = file_parser.get_ast_from_file(str(src))
+    assert file_parser.get_ast_from_file(str(src)) is tree
+    assert file_parser.get_ast_from_file(src) is tree